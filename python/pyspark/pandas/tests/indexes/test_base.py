@@ -16,7 +16,6 @@
 #
 
 import unittest
-from datetime import datetime
 
 import numpy as np
 import pandas as pd
@@ -27,44 +26,102 @@ from pyspark.pandas.exceptions import PandasNotImplementedError
 from pyspark.testing.pandasutils import PandasOnSparkTestCase, TestUtils, SPARK_CONF_ARROW_ENABLED
 
 
+_RNG = np.random.default_rng(0)
+_RANDN_10_5 = _RNG.standard_normal((10, 5))
+_RANDN_10 = _RNG.standard_normal(10)
+_RANDINT_10 = _RNG.integers(100, size=10)
+# Frames built on these arrays may share their memory, so keep them read-only.
+_RANDN_10_5.setflags(write=False)
+_RANDN_10.setflags(write=False)
+_RANDINT_10.setflags(write=False)
+
+_TS_1990 = pd.Timestamp("1990-03-09")
+_TS_2019 = pd.Timestamp("2019-08-15")
+
+
 class IndexesTestsMixin:
-    @property
-    def pdf(self):
-        return pd.DataFrame(
+    _SMALL_INDEX_FIXTURES = [
+        pd.Index([1, 2, 3, 4]),
+        pd.Index([1.1, 2.2, 3.3, 4.4]),
+        pd.Index(["A", "B", "C", "D"]),
+        pd.Index([True, False, True, False]),
+        pd.MultiIndex.from_tuples([("x", "a"), ("x", "b"), ("y", "a")]),
+        pd.MultiIndex.from_tuples([(10, 1), (10, 2), (20, 1)]),
+    ]
+
+    _ARROW_CONFS = {
+        SPARK_CONF_ARROW_ENABLED: "true",
+        # Disable fallback so a failed Arrow conversion is not silently retried without Arrow.
+        "spark.sql.execution.arrow.pyspark.fallback.enabled": "false",
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._old_arrow_confs = {key: cls.spark.conf.get(key, None) for key in cls._ARROW_CONFS}
+        for key, value in cls._ARROW_CONFS.items():
+            cls.spark.conf.set(key, value)
+
+        cls._pdf = pd.DataFrame(
             {"a": [1, 2, 3, 4, 5, 6, 7, 8, 9], "b": [4, 5, 6, 3, 2, 1, 0, 0, 0]},
             index=[0, 1, 3, 5, 6, 8, 9, 9, 9],
         )
+        cls._psdf = ps.from_pandas(cls._pdf)
+        cls._pmidx = pd.MultiIndex.from_arrays(
+            [[1, 1, 2, 2], ["red", "blue", "red", "blue"]], names=("number", "color")
+        )
+        cls._psmidx = ps.from_pandas(cls._pmidx)
+        cls._ps_small_index_fixtures = [ps.from_pandas(p) for p in cls._SMALL_INDEX_FIXTURES]
+        cls._date_psidx = ps.from_pandas(pd.date_range("2011-01-01", freq="D", periods=10))
+
+    @classmethod
+    def tearDownClass(cls):
+        for key, old_value in cls._old_arrow_confs.items():
+            if old_value is None:
+                cls.spark.conf.unset(key)
+            else:
+                cls.spark.conf.set(key, old_value)
+        super().tearDownClass()
+
+    @property
+    def pdf(self):
+        return self._pdf
 
     @property
     def psdf(self):
-        return ps.from_pandas(self.pdf)
+        return self._psdf
 
     def test_index_basic(self):
-        for pdf in [
-            pd.DataFrame(np.random.randn(10, 5), index=np.random.randint(100, size=10)),
-            pd.DataFrame(
-                np.random.randn(10, 5), index=np.random.randint(100, size=10).astype(np.int32)
-            ),
-            pd.DataFrame(np.random.randn(10, 5), index=np.random.randn(10)),
-            pd.DataFrame(np.random.randn(10, 5), index=np.random.randn(10).astype(np.float32)),
-            pd.DataFrame(np.random.randn(10, 5), index=list("abcdefghij")),
-            pd.DataFrame(
-                np.random.randn(10, 5), index=pd.date_range("2011-01-01", freq="D", periods=10)
-            ),
-            pd.DataFrame(np.random.randn(10, 5), index=pd.Categorical(list("abcdefghij"))),
-            pd.DataFrame(np.random.randn(10, 5), columns=list("abcde")).set_index(["a", "b"]),
-        ]:
-            psdf = ps.from_pandas(pdf)
-            self.assert_eq(psdf.index, pdf.index)
-            self.assert_eq(psdf.index.dtype, pdf.index.dtype)
+        pdfs = [
+            pd.DataFrame(_RANDN_10_5, index=_RANDINT_10.astype(np.int64)),
+            pd.DataFrame(_RANDN_10_5, index=_RANDINT_10.astype(np.int32)),
+            pd.DataFrame(_RANDN_10_5, index=_RANDN_10),
+            pd.DataFrame(_RANDN_10_5, index=_RANDN_10.astype(np.float32)),
+            pd.DataFrame(_RANDN_10_5, index=list("abcdefghij")),
+            pd.DataFrame(_RANDN_10_5, index=pd.date_range("2011-01-01", freq="D", periods=10)),
+            pd.DataFrame(_RANDN_10_5, index=pd.Categorical(list("abcdefghij"))),
+            pd.DataFrame(_RANDN_10_5, columns=list("abcde")).set_index(["a", "b"]),
+        ]
+        psdfs = [ps.from_pandas(pdf) for pdf in pdfs]
+
+        for i, (pdf, psdf) in enumerate(zip(pdfs, psdfs)):
+            with self.subTest(case=i, index_type=type(pdf.index).__name__):
+                self.assert_eq(psdf.index, pdf.index)
+                self.assert_eq(psdf.index.dtype, pdf.index.dtype)
 
         self.assert_eq(ps.Index([])._summary(), "Index: 0 entries")
         with self.assertRaisesRegex(ValueError, "The truth value of a Index is ambiguous."):
             bool(ps.Index([1]))
-        with self.assertRaisesRegex(TypeError, "Index.name must be a hashable type"):
-            ps.Index([1, 2, 3], name=[(1, 2, 3)])
-        with self.assertRaisesRegex(TypeError, "Index.name must be a hashable type"):
-            ps.Index([1.0, 2.0, 3.0], name=[(1, 2, 3)])
+
+    def test_index_unhashable_name(self):
+        for data, name in [
+            ([1, 2, 3], [(1, 2, 3)]),
+            ([1.0, 2.0, 3.0], [(1, 2, 3)]),
+            ([1, 2, 3], ["0", "1"]),
+        ]:
+            with self.subTest(data=data, name=name):
+                with self.assertRaisesRegex(TypeError, "Index.name must be a hashable type"):
+                    ps.Index(data, name=name)
 
     def test_index_getattr(self):
         psidx = self.psdf.index
@@ -74,14 +131,10 @@ class IndexesTestsMixin:
         with self.assertRaisesRegex(AttributeError, expected_error_message):
             psidx.__getattr__(item)
         with self.assertRaisesRegex(AttributeError, expected_error_message):
-            ps.from_pandas(pd.date_range("2011-01-01", freq="D", periods=10)).__getattr__(item)
+            self._date_psidx.__getattr__(item)
 
     def test_multi_index_getattr(self):
-        arrays = [[1, 1, 2, 2], ["red", "blue", "red", "blue"]]
-        idx = pd.MultiIndex.from_arrays(arrays, names=("number", "color"))
-        pdf = pd.DataFrame(np.random.randn(4, 5), idx)
-        psdf = ps.from_pandas(pdf)
-        psidx = psdf.index
+        psidx = self._psmidx
         item = "databricks"
 
         expected_error_message = "'MultiIndex' object has no attribute '{}'".format(item)
@@ -93,7 +146,7 @@ class IndexesTestsMixin:
         self.assertIsNone(psdf.index.name)
 
         idx = pd.Index([0, 1, 2, 3, 4, 5, 6, 7, 8, 9], name="x")
-        pdf = pd.DataFrame(np.random.randn(10, 5), index=idx, columns=list("abcde"))
+        pdf = pd.DataFrame(_RANDN_10_5, index=idx, columns=list("abcde"))
         psdf = ps.from_pandas(pdf)
 
         pser = pdf.a
@@ -132,8 +185,6 @@ class IndexesTestsMixin:
             psidx.names = ["0", "1"]
 
         expected_error_message = "Index.name must be a hashable type"
-        with self.assertRaisesRegex(TypeError, expected_error_message):
-            ps.Index([1, 2, 3], name=["0", "1"])
         with self.assertRaisesRegex(TypeError, expected_error_message):
             psidx.name = ["renamed"]
         with self.assertRaisesRegex(TypeError, expected_error_message):
@@ -146,15 +197,10 @@ class IndexesTestsMixin:
                 ps.Index([(1, 2), (3, 4)], names=["a", ["b"]])
 
     def test_multi_index_names(self):
-        arrays = [[1, 1, 2, 2], ["red", "blue", "red", "blue"]]
-        idx = pd.MultiIndex.from_arrays(arrays, names=("number", "color"))
-        pdf = pd.DataFrame(np.random.randn(4, 5), idx)
-        psdf = ps.from_pandas(pdf)
-
-        self.assertEqual(psdf.index.names, pdf.index.names)
+        self.assertEqual(self._psmidx.names, self._pmidx.names)
 
-        pidx = pdf.index
-        psidx = psdf.index
+        pidx = self._pmidx.copy()
+        psidx = self._psmidx.copy()
         pidx.names = ["renamed_number", "renamed_color"]
         psidx.names = ["renamed_number", "renamed_color"]
         self.assertEqual(psidx.names, pidx.names)
@@ -170,48 +216,34 @@ class IndexesTestsMixin:
             psidx.name = "renamed"
 
     def test_multi_index_copy(self):
-        arrays = [[1, 1, 2, 2], ["red", "blue", "red", "blue"]]
-        idx = pd.MultiIndex.from_arrays(arrays, names=("number", "color"))
-        pdf = pd.DataFrame(np.random.randn(4, 5), idx)
-        psdf = ps.from_pandas(pdf)
-
-        self.assert_eq(psdf.index.copy(), pdf.index.copy())
+        self.assert_eq(self._psmidx.copy(), self._pmidx.copy())
 
     def test_multiindex_set_names(self):
         pidx = pd.MultiIndex.from_tuples([("a", "x", 1), ("b", "y", 2), ("c", "z", 3)])
         psidx = ps.from_pandas(pidx)
 
-        pidx = pidx.set_names(["set", "new", "names"])
-        psidx = psidx.set_names(["set", "new", "names"])
-        self.assert_eq(pidx, psidx)
-
-        pidx.set_names(["set", "new", "names"], inplace=True)
-        psidx.set_names(["set", "new", "names"], inplace=True)
-        self.assert_eq(pidx, psidx)
-
-        pidx = pidx.set_names("first", level=0)
-        psidx = psidx.set_names("first", level=0)
-        self.assert_eq(pidx, psidx)
-
-        pidx = pidx.set_names("second", level=1)
-        psidx = psidx.set_names("second", level=1)
-        self.assert_eq(pidx, psidx)
-
-        pidx = pidx.set_names("third", level=2)
-        psidx = psidx.set_names("third", level=2)
-        self.assert_eq(pidx, psidx)
-
-        pidx.set_names("first", level=0, inplace=True)
-        psidx.set_names("first", level=0, inplace=True)
-        self.assert_eq(pidx, psidx)
-
-        pidx.set_names("second", level=1, inplace=True)
-        psidx.set_names("second", level=1, inplace=True)
-        self.assert_eq(pidx, psidx)
+        for names, level, inplace in [
+            (["set", "new", "names"], None, False),
+            (["set", "new", "names"], None, True),
+            ("first", 0, False),
+            ("second", 1, False),
+            ("third", 2, False),
+            ("first", 0, True),
+            ("second", 1, True),
+            ("third", 2, True),
+        ]:
+            with self.subTest(names=names, level=level, inplace=inplace):
+                if inplace:
+                    pidx.set_names(names, level=level, inplace=True)
+                    psidx.set_names(names, level=level, inplace=True)
+                else:
+                    pidx = pidx.set_names(names, level=level)
+                    psidx = psidx.set_names(names, level=level)
+                # set_names only touches metadata, so compare names on the driver per step
+                # and collect the values once at the end.
+                self.assertEqual(psidx.names, pidx.names)
 
-        pidx.set_names("third", level=2, inplace=True)
-        psidx.set_names("third", level=2, inplace=True)
-        self.assert_eq(pidx, psidx)
+        self.assert_eq(psidx, pidx)
 
     def test_multiindex_tuple_column_name(self):
         column_labels = pd.MultiIndex.from_tuples([("a", "x"), ("a", "y"), ("b", "z")])
@@ -220,27 +252,11 @@ class IndexesTestsMixin:
         psdf = ps.from_pandas(pdf)
         self.assert_eq(pdf, psdf)
 
-    def test_holds_integer(self):
-        pidx = pd.Index([1, 2, 3, 4])
-        psidx = ps.from_pandas(pidx)
-        self.assert_eq(pidx.holds_integer(), psidx.holds_integer())
-
-        pidx = pd.Index([1.1, 2.2, 3.3, 4.4])
-        psidx = ps.from_pandas(pidx)
-        self.assert_eq(pidx.holds_integer(), psidx.holds_integer())
-
-        pidx = pd.Index(["A", "B", "C", "D"])
-        psidx = ps.from_pandas(pidx)
-        self.assert_eq(pidx.holds_integer(), psidx.holds_integer())
-
-        # MultiIndex
-        pmidx = pd.MultiIndex.from_tuples([("x", "a"), ("x", "b"), ("y", "a")])
-        psmidx = ps.from_pandas(pmidx)
-        self.assert_eq(pmidx.holds_integer(), psmidx.holds_integer())
-
-        pmidx = pd.MultiIndex.from_tuples([(10, 1), (10, 2), (20, 1)])
-        psmidx = ps.from_pandas(pmidx)
-        self.assert_eq(pmidx.holds_integer(), psmidx.holds_integer())
+    def test_holds_integer_and_inferred_type(self):
+        for pidx, psidx in zip(self._SMALL_INDEX_FIXTURES, self._ps_small_index_fixtures):
+            with self.subTest(pidx=pidx):
+                self.assert_eq(pidx.holds_integer(), psidx.holds_integer())
+                self.assert_eq(pidx.inferred_type, psidx.inferred_type)
 
     def test_item(self):
         pidx = pd.Index([10])
@@ -249,7 +265,7 @@ class IndexesTestsMixin:
         self.assert_eq(pidx.item(), psidx.item())
 
         # with timestamp
-        pidx = pd.Index([datetime(1990, 3, 9)])
+        pidx = pd.Index([_TS_1990])
         psidx = ps.from_pandas(pidx)
 
         self.assert_eq(pidx.item(), psidx.item())
@@ -261,10 +277,10 @@ class IndexesTestsMixin:
         self.assert_eq(pmidx.item(), psmidx.item())
 
         # MultiIndex with timestamp
-        pmidx = pd.MultiIndex.from_tuples([(datetime(1990, 3, 9), datetime(2019, 8, 15))])
+        pmidx = pd.MultiIndex.from_tuples([(_TS_1990, _TS_2019)])
         psmidx = ps.from_pandas(pmidx)
 
-        self.assert_eq(pidx.item(), psidx.item())
+        self.assert_eq(pmidx.item(), psmidx.item())
 
         err_msg = "can only convert an array of size 1 to a Python scalar"
         with self.assertRaisesRegex(ValueError, err_msg):
@@ -272,32 +288,6 @@ class IndexesTestsMixin:
         with self.assertRaisesRegex(ValueError, err_msg):
             ps.MultiIndex.from_tuples([("a", "x"), ("b", "y")]).item()
 
-    def test_inferred_type(self):
-        # Integer
-        pidx = pd.Index([1, 2, 3])
-        psidx = ps.from_pandas(pidx)
-        self.assert_eq(pidx.inferred_type, psidx.inferred_type)
-
-        # Floating
-        pidx = pd.Index([1.0, 2.0, 3.0])
-        psidx = ps.from_pandas(pidx)
-        self.assert_eq(pidx.inferred_type, psidx.inferred_type)
-
-        # String
-        pidx = pd.Index(["a", "b", "c"])
-        psidx = ps.from_pandas(pidx)
-        self.assert_eq(pidx.inferred_type, psidx.inferred_type)
-
-        # Boolean
-        pidx = pd.Index([True, False, True, False])
-        psidx = ps.from_pandas(pidx)
-        self.assert_eq(pidx.inferred_type, psidx.inferred_type)
-
-        # MultiIndex
-        pmidx = pd.MultiIndex.from_tuples([("a", "x")])
-        psmidx = ps.from_pandas(pmidx)
-        self.assert_eq(pmidx.inferred_type, psmidx.inferred_type)
-
     def test_view(self):
         pidx = pd.Index([1, 2, 3, 4], name="Koalas")
         psidx = ps.from_pandas(pidx)